@@ -1,11 +1,37 @@
 # data-science-service/app/api/endpoints/ai_coach.py
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from app.core.models import AICoachRequest, AICoachResponse, ErrorResponse
 from app.core.config import settings
+from app.services.coach_context_service import coach_context_cache
+from app.services.single_flight import single_flight, canonical_key
+from app.services.admission_control import admission_controller, PriorityClass
 import asyncio # For simulating async LLM calls
+import json
+from datetime import date
 
 router = APIRouter()
 
+# Fallback user data used until real analyses (or a MongoDB lookup) provide it
+DEFAULT_USER_DATA = {
+    "recent_mood": "neutral",
+    "last_workout": "yesterday",
+    "sleep_quality": "good",
+    "goals": ["lose weight", "reduce stress"]
+}
+
+def _describe_last_workout(user_data: dict) -> str:
+    # Pose analyses record the date of the workout; render it relative to today so
+    # a snapshot built before midnight doesn't keep saying "today"
+    workout_date = user_data.get("last_workout_date")
+    if workout_date is None:
+        return user_data["last_workout"]
+    days_ago = (date.today() - date.fromisoformat(workout_date)).days
+    if days_ago <= 0:
+        return "today"
+    if days_ago == 1:
+        return "yesterday"
+    return f"{days_ago} days ago"
+
 # Placeholder for a more sophisticated LLM integration (e.g., OpenAI, Gemini, custom finetuned)
 async def get_llm_response(user_id: str, message: str, context: dict = None) -> str:
     """
@@ -14,16 +40,15 @@ async def get_llm_response(user_id: str, message: str, context: dict = None) ->
     """
     await asyncio.sleep(1) # Simulate network/processing delay
 
-    # Access user data (simulated)
-    # In a real scenario, you'd fetch data from MongoDB using the userId
-    user_data = {
-        "recent_mood": "neutral",
-        "last_workout": "yesterday",
-        "sleep_quality": "good",
-        "goals": ["lose weight", "reduce stress"]
-    }
+    # Access user data from the per-user context snapshot, which the journal
+    # and pose endpoints keep up to date. A warm cache needs no store round trips.
+    user_data = coach_context_cache.get(user_id)
+    if user_data is None:
+        # In a real scenario, you'd fetch data from MongoDB using the userId
+        user_data = dict(DEFAULT_USER_DATA)
+        coach_context_cache.put(user_id, user_data)
     # For a truly personalized coach, this would dynamically change based on actual data
-    personalized_greeting = f"Hi there! Based on your recent activities, I see your mood is {user_data['recent_mood']} and you last worked out {user_data['last_workout']}."
+    personalized_greeting = f"Hi there! Based on your recent activities, I see your mood is {user_data['recent_mood']} and you last worked out {_describe_last_workout(user_data)}."
     if "reduce stress" in user_data["goals"]:
         personalized_greeting += " It looks like you're aiming to reduce stress."
 
@@ -38,14 +63,19 @@ async def get_llm_response(user_id: str, message: str, context: dict = None) ->
     else:
         return f"Thanks for reaching out! I'm here to assist you. You mentioned: '{message}'. What specifically would you like to focus on?"
 
-@router.post("/coach-chat", response_model=AICoachResponse, responses={400: {"model": ErrorResponse}, 500: {"model": ErrorResponse}})
+@router.post("/coach-chat", dependencies=[Depends(admission_controller.guard("coach-chat", PriorityClass.INTERACTIVE))], response_model=AICoachResponse, responses={400: {"model": ErrorResponse}, 429: {"model": ErrorResponse}, 500: {"model": ErrorResponse}, 503: {"model": ErrorResponse}})
 async def ai_coach_chat(request: AICoachRequest):
     """
     Endpoint for AI Coach chat interactions.
     Processes user messages and generates personalized responses.
     """
     try:
-        llm_response_text = await get_llm_response(request.userId, request.message, request.context)
+        # Retried duplicates of the same user's message and context share one LLM call
+        context_key = json.dumps(request.context, sort_keys=True, separators=(",", ":"), default=str) if request.context else ""
+        llm_response_text = await single_flight.do(
+            canonical_key("coach-chat", request.userId, request.message, context_key),
+            lambda: get_llm_response(request.userId, request.message, request.context)
+        )
         
         # Simulate simple suggestions based on LLM response
         suggestions = []
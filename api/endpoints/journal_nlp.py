@@ -1,18 +1,34 @@
 # data-science-service/app/api/endpoints/journal_nlp.py
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from app.core.models import JournalNLPRequest, JournalNLPResponse, ErrorResponse
 from app.services.nlp_service import nlp_service
+from app.services.coach_context_service import coach_context_cache
+from app.services.single_flight import single_flight, canonical_key
+from app.services.admission_control import admission_controller, PriorityClass
+import asyncio
 
 router = APIRouter()
 
-@router.post("/journal-nlp", response_model=JournalNLPResponse, responses={400: {"model": ErrorResponse}, 500: {"model": ErrorResponse}})
+def _analyze_journal_text(journal_text: str):
+    sentiment_result = nlp_service.analyze_sentiment(journal_text)
+    stress_burnout_estimates = nlp_service.estimate_stress_burnout(journal_text, sentiment_result.sentimentScore)
+    return sentiment_result, stress_burnout_estimates
+
+@router.post("/journal-nlp", dependencies=[Depends(admission_controller.guard("journal-nlp", PriorityClass.INTERACTIVE))], response_model=JournalNLPResponse, responses={400: {"model": ErrorResponse}, 429: {"model": ErrorResponse}, 500: {"model": ErrorResponse}, 503: {"model": ErrorResponse}})
 async def analyze_journal_entry_endpoint(request: JournalNLPRequest):
     """
     Performs NLP analysis on a journal entry to detect mood, stress, and burnout risk.
     """
     try:
-        sentiment_result = nlp_service.analyze_sentiment(request.journalText)
-        stress_burnout_estimates = nlp_service.estimate_stress_burnout(request.journalText, sentiment_result.sentimentScore)
+        # Identical journal texts in flight at the same time share one analysis.
+        # The analysis runs in a worker thread so duplicates can actually overlap.
+        sentiment_result, stress_burnout_estimates = await single_flight.do(
+            canonical_key("journal-nlp", request.journalText),
+            lambda: asyncio.to_thread(_analyze_journal_text, request.journalText)
+        )
+
+        # Keep the AI Coach context snapshot fresh for this user
+        coach_context_cache.record_journal(request.userId, sentiment_result.overallSentiment)
 
         # In a real app, you might also update the MongoDB JournalEntry document here
         # or have the Node.js backend handle the update after receiving this response.
@@ -1,11 +1,14 @@
 # data-science-service/app/api/endpoints/meal_ocr.py
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from app.core.models import MealOCRRequest, MealOCRResponse, ErrorResponse
+from app.core.responses import FastJSONResponse
 from app.services.ocr_service import ocr_service
+from app.services.single_flight import single_flight, canonical_key
+from app.services.admission_control import admission_controller, PriorityClass
 
 router = APIRouter()
 
-@router.post("/meal-ocr", response_model=MealOCRResponse, responses={400: {"model": ErrorResponse}, 500: {"model": ErrorResponse}})
+@router.post("/meal-ocr", dependencies=[Depends(admission_controller.guard("meal-ocr", PriorityClass.INTERACTIVE))], response_model=MealOCRResponse, response_class=FastJSONResponse, responses={400: {"model": ErrorResponse}, 429: {"model": ErrorResponse}, 500: {"model": ErrorResponse}, 503: {"model": ErrorResponse}})
 async def analyze_meal_photo_endpoint(request: MealOCRRequest):
     """
     Analyzes a meal photo using OCR and image recognition.
@@ -13,7 +16,11 @@ async def analyze_meal_photo_endpoint(request: MealOCRRequest):
     """
     try:
         # Pass the request data to the OCR service for analysis
-        food_predictions = await ocr_service.analyze_meal_photo(request.imageUrl, request.userId)
+        # Identical image URLs in flight at the same time share one fetch, decode and inference
+        food_predictions = await single_flight.do(
+            canonical_key("meal-ocr", str(request.imageUrl).strip()),
+            lambda: ocr_service.analyze_meal_photo(request.imageUrl, request.userId)
+        )
 
         if not food_predictions:
             raise HTTPException(
@@ -26,11 +33,12 @@ async def analyze_meal_photo_endpoint(request: MealOCRRequest):
         # In a real app, you might also trigger an update to the MongoDB MealEntry document here
         # or have the Node.js backend handle the update after receiving this response.
 
-        return MealOCRResponse(
+        # Predictions are built by our own OCR service, so skip re-validation on the way out
+        return FastJSONResponse(MealOCRResponse.model_construct(
             totalCalories=total_calories,
             estimatedFoods=food_predictions,
             accuracyScore=0.85 # Example accuracy score
-        )
+        ))
     except ValueError as ve:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
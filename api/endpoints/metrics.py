@@ -0,0 +1,19 @@
+# data-science-service/app/api/endpoints/metrics.py
+from fastapi import APIRouter
+from app.services.admission_control import admission_controller
+from app.services.single_flight import single_flight
+from app.services.coach_context_service import coach_context_cache
+
+router = APIRouter()
+
+@router.get("/metrics/runtime")
+async def runtime_metrics():
+    """
+    Reports admission queue depth and shed counts per priority class,
+    request coalescing counts and AI Coach context cache hit rate.
+    """
+    return {
+        "admission": admission_controller.stats(),
+        "singleFlight": single_flight.stats(),
+        "coachContextCache": coach_context_cache.stats(),
+    }
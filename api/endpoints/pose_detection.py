@@ -1,27 +1,39 @@
 # data-science-service/app/api/endpoints/pose_detection.py
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from app.core.models import PoseDetectionRequest, PoseDetectionResponse, ErrorResponse
+from app.core.responses import FastJSONResponse
 from app.services.pose_service import pose_service
+from app.services.coach_context_service import coach_context_cache
+from app.services.admission_control import admission_controller, PriorityClass
+import asyncio
 
 router = APIRouter()
 
-@router.post("/pose-detection", response_model=PoseDetectionResponse, responses={400: {"model": ErrorResponse}, 500: {"model": ErrorResponse}})
+@router.post("/pose-detection", dependencies=[Depends(admission_controller.guard("pose-detection", PriorityClass.REALTIME))], response_model=PoseDetectionResponse, response_class=FastJSONResponse, responses={400: {"model": ErrorResponse}, 429: {"model": ErrorResponse}, 500: {"model": ErrorResponse}, 503: {"model": ErrorResponse}})
 async def analyze_pose_endpoint(request: PoseDetectionRequest):
     """
     Analyzes body posture and form from image data (e.g., from webcam stream).
     Provides real-time feedback for workouts.
     """
     try:
-        analysis_result = pose_service.analyze_pose(request.imageData, request.userId, request.exerciseType)
+        # Not coalesced: live frames almost never repeat byte for byte, so hashing each
+        # one for single-flight would cost more than it saves. The analysis runs in a
+        # worker thread so it doesn't block the event loop at frame rate.
+        analysis_result = await asyncio.to_thread(pose_service.analyze_pose, request.imageData, request.userId, request.exerciseType)
+
+        # Keep the AI Coach context snapshot fresh for this user
+        coach_context_cache.record_pose(request.userId)
 
         # In a real app, you might update the MongoDB Workout document with analysis results here
         # or have the Node.js backend handle the update.
 
-        return PoseDetectionResponse(
+        # The result comes from our own pose service (feedback items are prebuilt templates),
+        # so skip re-validation and encode straight to JSON at frame rate.
+        return FastJSONResponse(PoseDetectionResponse.model_construct(
             overallScore=analysis_result["overallScore"],
             feedback=analysis_result["feedback"],
             repetitionCount=analysis_result.get("repetitionCount")
-        )
+        ))
     except ValueError as ve:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -0,0 +1,150 @@
+# Load test for admission control: overloads a small controller with a mix of
+# priority classes and checks scheduling order, deadline shedding, queue limits
+# and slot release on cancellation.
+import asyncio
+import time
+
+from app.services.admission_control import AdmissionController, AdmissionRejected, PriorityClass
+
+MAX_CONCURRENCY = 4
+WORK_SECONDS = 0.05 # simulated inference time per request
+BURST = {
+    # class: (requests, deadline seconds)
+    PriorityClass.REALTIME: (40, 0.3),
+    PriorityClass.INTERACTIVE: (30, 10.0),
+    PriorityClass.BULK: (30, 60.0),
+}
+
+
+async def run_burst():
+    controller = AdmissionController(max_concurrency=MAX_CONCURRENCY, endpoint_limits={}, max_queue_depth=32)
+    finished = {cls: [] for cls in PriorityClass}
+
+    async def handle(cls: PriorityClass, deadline_seconds: float):
+        started = time.perf_counter()
+        try:
+            await controller.acquire(cls.name.lower(), cls, time.monotonic() + deadline_seconds)
+        except AdmissionRejected:
+            return
+        try:
+            await asyncio.sleep(WORK_SECONDS)
+        finally:
+            controller.release(cls.name.lower(), WORK_SECONDS)
+        finished[cls].append(time.perf_counter() - started)
+
+    # Lowest class first, so higher classes only get ahead through scheduling
+    await asyncio.gather(*(
+        handle(cls, BURST[cls][1])
+        for cls in sorted(BURST, reverse=True)
+        for _ in range(BURST[cls][0])
+    ))
+    return controller.stats(), finished
+
+
+async def _hold(controller: AdmissionController, endpoint: str = "x") -> None:
+    await controller.acquire(endpoint, PriorityClass.REALTIME, time.monotonic() + 1)
+
+
+async def check_priority_order():
+    controller = AdmissionController(max_concurrency=1, endpoint_limits={}, max_queue_depth=10)
+    await _hold(controller)
+    order = []
+
+    async def queued(cls: PriorityClass):
+        await controller.acquire("x", cls, time.monotonic() + 1)
+        order.append(cls)
+        await asyncio.sleep(0)
+        controller.release("x")
+
+    tasks = [asyncio.ensure_future(queued(cls)) for cls in (PriorityClass.BULK, PriorityClass.INTERACTIVE, PriorityClass.REALTIME)]
+    await asyncio.sleep(0)
+    controller.release("x")
+    await asyncio.gather(*tasks)
+    assert order == [PriorityClass.REALTIME, PriorityClass.INTERACTIVE, PriorityClass.BULK], f"wrong order {order}"
+
+
+async def check_deadline_shedding():
+    controller = AdmissionController(max_concurrency=1, endpoint_limits={}, max_queue_depth=10)
+    await _hold(controller)
+    try:
+        await controller.acquire("x", PriorityClass.REALTIME, time.monotonic() + 0.02)
+        raise AssertionError("a request queued past its deadline must be shed")
+    except AdmissionRejected as rejected:
+        assert rejected.status_code == 503 and rejected.retry_after >= 1
+    try:
+        await controller.acquire("x", PriorityClass.REALTIME, time.monotonic() - 1)
+        raise AssertionError("a request arriving past its deadline must be shed")
+    except AdmissionRejected as rejected:
+        assert rejected.status_code == 503
+    stats = controller.stats()
+    assert stats["classes"]["realtime"]["shed"] == 2 and stats["classes"]["realtime"]["queueDepth"] == 0
+    assert stats["classes"]["realtime"]["admitted"] == 1, "shed requests must not count as admitted"
+
+
+async def check_queue_full():
+    controller = AdmissionController(max_concurrency=1, endpoint_limits={}, max_queue_depth=2)
+    await _hold(controller)
+    waiting = [asyncio.ensure_future(controller.acquire("x", PriorityClass.BULK, time.monotonic() + 1)) for _ in range(2)]
+    await asyncio.sleep(0)
+    try:
+        await controller.acquire("x", PriorityClass.BULK, time.monotonic() + 1)
+        raise AssertionError("an arrival beyond the queue depth must be rejected")
+    except AdmissionRejected as rejected:
+        assert rejected.status_code == 429 and rejected.retry_after >= 1
+    # Queues are per class, so a full bulk queue doesn't block interactive requests
+    interactive = asyncio.ensure_future(controller.acquire("x", PriorityClass.INTERACTIVE, time.monotonic() + 1))
+    await asyncio.sleep(0)
+    assert controller.stats()["classes"]["interactive"]["queueDepth"] == 1
+    for task in (interactive, *waiting):
+        task.cancel()
+    await asyncio.gather(interactive, *waiting, return_exceptions=True)
+    assert controller.stats()["classes"]["bulk"]["rejected"] == 1
+
+
+async def check_cancellation_releases_slot():
+    controller = AdmissionController(max_concurrency=1, endpoint_limits={}, max_queue_depth=10)
+    await _hold(controller)
+
+    # Cancelled while queued: leaves the queue without taking a slot
+    queued = asyncio.ensure_future(controller.acquire("x", PriorityClass.INTERACTIVE, time.monotonic() + 1))
+    await asyncio.sleep(0)
+    queued.cancel()
+    await asyncio.gather(queued, return_exceptions=True)
+    assert controller.stats()["classes"]["interactive"]["queueDepth"] == 0
+
+    # Cancelled after the slot was handed over but before it resumed: either acquire
+    # hands the slot back, or (if wait_for keeps the result) the request's own release does
+    async def request():
+        await controller.acquire("x", PriorityClass.INTERACTIVE, time.monotonic() + 1)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            controller.release("x")
+
+    granted = asyncio.ensure_future(request())
+    await asyncio.sleep(0)
+    controller.release("x")
+    granted.cancel()
+    await asyncio.gather(granted, return_exceptions=True)
+    assert controller.stats()["active"] == 0, "a cancelled request must give its slot back"
+    await asyncio.wait_for(_hold(controller), timeout=0.1)
+
+
+async def main():
+    stats, finished = await run_burst()
+    total = sum(requests for requests, _ in BURST.values())
+    print(f"{total} requests over {MAX_CONCURRENCY} slots, {WORK_SECONDS * 1000:.0f} ms each")
+    for cls in PriorityClass:
+        counts = stats["classes"][cls.name.lower()]
+        latencies = sorted(finished[cls])
+        worst = f"{latencies[-1] * 1000:.0f} ms" if latencies else "-"
+        print(f"{cls.name.lower():<12} admitted {counts['admitted']:>3}  shed {counts['shed']:>3}  rejected {counts['rejected']:>3}  slowest {worst}")
+    await check_priority_order()
+    await check_deadline_shedding()
+    await check_queue_full()
+    await check_cancellation_releases_slot()
+    print("priority order, deadline shedding, queue limit and cancellation checks passed")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,172 @@
+# Benchmark for the fast response path on /pose-detection and /meal-ocr.
+# Compares the previous path (models built and validated per request, then revalidated
+# through response_model and encoded by FastAPI's JSONResponse) against prebuilt
+# feedback templates + model_construct + FastJSONResponse (orjson).
+import asyncio
+import json
+import statistics
+import time
+
+from fastapi import FastAPI
+
+from app.core.models import (
+    FoodItemPrediction, Macronutrients, MealOCRResponse, Micronutrients,
+    PoseDetectionResponse, PoseFeedbackItem,
+)
+from app.core.responses import FastJSONResponse
+from app.services.pose_service import FEEDBACK_TEMPLATES
+
+ITERATIONS = 20000
+ROUTE_ITERATIONS = 2000
+ROUTE_ROUNDS = 7
+
+FOODS = [
+    ("Rice", "104g (estimated)", 135.2, (2.8, 29.3, 0.3), (0.4, 0.0, 0.0)),
+    ("Dal", "97g (estimated)", 106.7, (8.7, 19.4, 0.5), (7.8, 0.0, 0.0)),
+    ("Roti", "55g (estimated)", 110.0, (3.3, 22.0, 1.7), (2.2, 0.0, 0.0)),
+]
+
+
+def pose_current() -> bytes:
+    feedback = [
+        PoseFeedbackItem(
+            joint="Knees",
+            feedback="Knees are caving inwards. This can put stress on your joints.",
+            correction="Push knees out, align them over your toes throughout the movement."
+        ),
+        PoseFeedbackItem(
+            joint="Back",
+            feedback="Your lower back is rounding slightly.",
+            correction="Keep your chest up and core engaged to maintain a neutral spine."
+        ),
+    ]
+    response = PoseDetectionResponse(overallScore=72, feedback=feedback, repetitionCount=12)
+    # What response_model does with a returned model: dump, validate, serialize, json.dumps
+    validated = PoseDetectionResponse.model_validate(response.model_dump())
+    return json.dumps(validated.model_dump(mode="json"), ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def pose_fast() -> bytes:
+    response = PoseDetectionResponse.model_construct(
+        overallScore=72,
+        feedback=[FEEDBACK_TEMPLATES["squat_knees"], FEEDBACK_TEMPLATES["squat_back"]],
+        repetitionCount=12
+    )
+    return FastJSONResponse(response).body
+
+
+def meal_current() -> bytes:
+    predictions = []
+    for name, quantity, calories, (protein, carbs, fats), (fiber, sugar, sodium) in FOODS:
+        # The previous analyze_meal_photo built each nutrient model twice
+        macros = Macronutrients(protein=protein, carbohydrates=carbs, fats=fats)
+        micros = Micronutrients(fiber=fiber, sugar=sugar, sodium=sodium)
+        predictions.append(FoodItemPrediction(
+            name=name,
+            quantity=quantity,
+            calories=calories,
+            macronutrients=Macronutrients(protein=macros.protein, carbohydrates=macros.carbohydrates, fats=macros.fats),
+            micronutrients=Micronutrients(fiber=micros.fiber, sugar=micros.sugar, sodium=micros.sodium)
+        ))
+    response = MealOCRResponse(totalCalories=sum(p.calories for p in predictions), estimatedFoods=predictions, accuracyScore=0.85)
+    validated = MealOCRResponse.model_validate(response.model_dump())
+    return json.dumps(validated.model_dump(mode="json"), ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def meal_fast() -> bytes:
+    predictions = [
+        FoodItemPrediction.model_construct(
+            name=name,
+            quantity=quantity,
+            calories=calories,
+            macronutrients=Macronutrients.model_construct(protein=protein, carbohydrates=carbs, fats=fats),
+            micronutrients=Micronutrients.model_construct(fiber=fiber, sugar=sugar, sodium=sodium)
+        )
+        for name, quantity, calories, (protein, carbs, fats), (fiber, sugar, sodium) in FOODS
+    ]
+    response = MealOCRResponse.model_construct(totalCalories=sum(p.calories for p in predictions), estimatedFoods=predictions, accuracyScore=0.85)
+    return FastJSONResponse(response).body
+
+
+def time_per_call(fn, iterations: int) -> float:
+    for _ in range(200):
+        fn()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/current/pose", response_model=PoseDetectionResponse)
+    async def current_pose():
+        # Per-request construction, as before the templates
+        feedback = [PoseFeedbackItem(**item.__dict__) for item in (FEEDBACK_TEMPLATES["squat_knees"], FEEDBACK_TEMPLATES["squat_back"])]
+        return PoseDetectionResponse(overallScore=72, feedback=feedback, repetitionCount=12)
+
+    @app.post("/fast/pose", response_model=PoseDetectionResponse, response_class=FastJSONResponse)
+    async def fast_pose():
+        return FastJSONResponse(PoseDetectionResponse.model_construct(
+            overallScore=72,
+            feedback=[FEEDBACK_TEMPLATES["squat_knees"], FEEDBACK_TEMPLATES["squat_back"]],
+            repetitionCount=12
+        ))
+
+    return app
+
+
+async def _call_route(app: FastAPI, path: str) -> None:
+    # Drive the ASGI app directly so client-side HTTP overhead doesn't drown the difference
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "POST",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "",
+        "query_string": b"", "headers": [], "client": ("127.0.0.1", 1), "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start" and message["status"] != 200:
+            raise RuntimeError(f"{path} returned {message['status']}")
+
+    await app(scope, receive, send)
+
+
+async def time_routes(iterations: int, rounds: int):
+    """
+    Alternates the two routes round by round and returns the median per-request time of each,
+    so drift in machine load affects both sides equally.
+    """
+    app = build_app()
+    for path in ("/current/pose", "/fast/pose"):
+        for _ in range(200):
+            await _call_route(app, path)
+    samples = {"/current/pose": [], "/fast/pose": []}
+    for _ in range(rounds):
+        for path in samples:
+            started = time.perf_counter()
+            for _ in range(iterations):
+                await _call_route(app, path)
+            samples[path].append((time.perf_counter() - started) / iterations)
+    return statistics.median(samples["/current/pose"]), statistics.median(samples["/fast/pose"])
+
+
+def main():
+    assert json.loads(pose_current()) == json.loads(pose_fast()), "pose payloads differ"
+    assert json.loads(meal_current()) == json.loads(meal_fast()), "meal payloads differ"
+
+    print(f"{'build + encode':<28}{'current us':>12}{'fast us':>10}{'speedup':>9}")
+    for label, current, fast in (("pose-detection", pose_current, pose_fast), ("meal-ocr (3 items)", meal_current, meal_fast)):
+        current_time = time_per_call(current, ITERATIONS)
+        fast_time = time_per_call(fast, ITERATIONS)
+        print(f"{label:<28}{current_time * 1e6:>12.1f}{fast_time * 1e6:>10.1f}{current_time / fast_time:>8.1f}x")
+
+    current_route, fast_route = asyncio.run(time_routes(ROUTE_ITERATIONS, ROUTE_ROUNDS))
+    print(f"{'pose route (direct ASGI)':<28}{current_route * 1e6:>12.1f}{fast_route * 1e6:>10.1f}{current_route / fast_route:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
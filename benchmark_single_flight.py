@@ -0,0 +1,83 @@
+# Load test for request coalescing: fires bursts of duplicate concurrent requests
+# and counts how many times the underlying work actually runs.
+import asyncio
+import time
+
+from app.services.single_flight import SingleFlight, canonical_key
+
+DISTINCT_KEYS = 20 # e.g. distinct image URLs / journal texts
+DUPLICATES_PER_KEY = 10 # concurrent retries of the same request
+WORK_SECONDS = 0.05 # simulated fetch + decode + inference time
+
+
+async def run(coalesce: bool):
+    flight = SingleFlight()
+    work_done = 0
+
+    async def analyze(payload: str):
+        nonlocal work_done
+        work_done += 1
+        await asyncio.sleep(WORK_SECONDS)
+        return f"result for {payload}"
+
+    async def handle(payload: str):
+        if coalesce:
+            return await flight.do(canonical_key("meal-ocr", payload), lambda: analyze(payload))
+        return await analyze(payload)
+
+    payloads = [f"https://images.example.com/meal-{i}.jpg" for i in range(DISTINCT_KEYS)]
+    started = time.perf_counter()
+    results = await asyncio.gather(*(handle(p) for p in payloads for _ in range(DUPLICATES_PER_KEY)))
+    elapsed = time.perf_counter() - started
+    assert all(r == f"result for {p}" for r, p in zip(results, (p for p in payloads for _ in range(DUPLICATES_PER_KEY))))
+    return work_done, elapsed, flight.stats()
+
+
+async def check_error_and_cancellation():
+    flight = SingleFlight()
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise ValueError("bad image")
+
+    outcomes = await asyncio.gather(*(flight.do("k", failing) for _ in range(5)), return_exceptions=True)
+    assert all(isinstance(o, ValueError) for o in outcomes), "every waiter should see the error"
+    assert flight.in_flight() == 0, "failed calls must not be cached"
+
+    async def slow():
+        await asyncio.sleep(0.05)
+        return "ok"
+
+    first = asyncio.ensure_future(flight.do("c", slow))
+    second = asyncio.ensure_future(flight.do("c", slow))
+    await asyncio.sleep(0)
+    first.cancel()
+    assert await second == "ok", "one waiter's cancellation must not affect the others"
+
+    lone = asyncio.ensure_future(flight.do("d", slow))
+    await asyncio.sleep(0)
+    lone.cancel()
+    await asyncio.sleep(0.01)
+    assert flight.in_flight() == 0, "work is cancelled once no one is waiting"
+
+    # A retry arriving right after the last waiter was cancelled must not join the dying task
+    abandoned = asyncio.ensure_future(flight.do("e", slow))
+    await asyncio.sleep(0)
+    abandoned.cancel()
+    await asyncio.sleep(0)
+    assert await flight.do("e", slow) == "ok", "a new caller must not inherit another caller's cancellation"
+
+
+async def main():
+    total = DISTINCT_KEYS * DUPLICATES_PER_KEY
+    baseline_work, baseline_time, _ = await run(coalesce=False)
+    coalesced_work, coalesced_time, stats = await run(coalesce=True)
+    print(f"{total} requests, {DISTINCT_KEYS} distinct")
+    print(f"without single-flight: {baseline_work} executions in {baseline_time:.3f}s")
+    print(f"with single-flight:    {coalesced_work} executions in {coalesced_time:.3f}s  {stats}")
+    await check_error_and_cancellation()
+    print("error propagation and cancellation checks passed")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,6 +1,6 @@
 # data-science-service/app/core/config.py
 import os
-from typing import List, Union
+from typing import Dict, List, Union
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import AnyHttpUrl, Field
 
@@ -36,4 +36,24 @@ class Settings(BaseSettings):
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
 
+    # AI Coach per-user context snapshot cache
+    COACH_CONTEXT_TTL_SECONDS: float = 900.0 # Snapshots older than this are refetched
+    COACH_CONTEXT_MAX_USERS: int = 10000 # Least recently used users are evicted beyond this
+    COACH_CONTEXT_CHANNEL: str = "coach-context-updates" # Redis pub/sub channel shared by all workers
+
+    # Admission control across AI endpoints
+    ADMISSION_MAX_CONCURRENCY: int = 16 # Shared worker slots across all endpoints
+    ADMISSION_ENDPOINT_LIMITS: Dict[str, int] = {
+        "pose-detection": 10,
+        "coach-chat": 6,
+        "journal-nlp": 4,
+        "meal-ocr": 4,
+    }
+    ADMISSION_MAX_QUEUE_DEPTH: int = 64 # Per priority class; arrivals beyond this get a 429
+    ADMISSION_DEADLINE_MS: Dict[str, int] = { # Default queueing budget per priority class
+        "realtime": 300,
+        "interactive": 10000,
+        "bulk": 60000,
+    }
+
 settings = Settings()
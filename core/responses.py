@@ -0,0 +1,28 @@
+# data-science-service/app/core/responses.py
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def _default(obj: Any) -> Any:
+    # Pydantic models are emitted from their field values as-is. orjson calls this again
+    # for nested models, so a whole response tree is encoded without model_dump() or
+    # re-validation. Only use it for trusted results built by our own services.
+    if isinstance(obj, BaseModel):
+        return obj.__dict__
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    orjson-backed response for high-volume endpoints (pose frames, meal analyses).
+
+    Returning this directly from a route bypasses FastAPI's response_model validation
+    and jsonable_encoder pass; keep response_model on the route for the OpenAPI schema.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_SERIALIZE_NUMPY)
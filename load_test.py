@@ -0,0 +1,585 @@
+# Load generator for the data science service's AI endpoints (coach chat, meal OCR,
+# journal NLP, pose detection). It sends the request models the FastAPI endpoints
+# accept, not what routes/ai.js currently sends; see TrafficMix. Arrivals are
+# open-loop (Poisson at the target RPS), so a slow server builds up in-flight
+# requests instead of quietly lowering the offered load.
+#
+# Usage:
+#   python load_test.py --rps 50 --duration 30                      # app in-process
+#   python load_test.py --rps 200 --spawn-uvicorn --workers 4       # app under uvicorn
+#   python load_test.py --url http://localhost:8000 --server-pid 1234
+#   python load_test.py --mix chat=1,meal=1,journal=1,pose=6
+import argparse
+import asyncio
+import base64
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+import cv2
+import httpx
+import numpy as np
+
+ENDPOINTS = {
+    "chat": "/coach-chat",
+    "meal": "/meal-ocr",
+    "journal": "/journal-nlp",
+    "pose": "/pose-detection",
+}
+DEFAULT_MIX = "chat=3,meal=1,journal=2,pose=4"
+
+CHAT_MESSAGES = [
+    "hello", "Can you help with my diet?", "I feel a lot of stress this week",
+    "Suggest a workout for today", "How did I sleep?",
+]
+JOURNAL_TEXTS = [
+    "Today was productive, I hit my goals and feel great.",
+    "Feeling overwhelmed with the deadline and exhausted, lots of pressure at work.",
+    "A quiet day. Went for a walk and cooked dinner.",
+    "No motivation lately, drained and frustrated with everything.",
+]
+EXERCISES = ["squat", "plank", "yoga_tree_pose", "pushup"]
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _synthetic_jpeg(seed: int, size: int = 320) -> bytes:
+    rng = np.random.default_rng(seed)
+    image = rng.integers(0, 255, (size, size, 3), dtype=np.uint8)
+    cv2.circle(image, (size // 2, size // 2), size // 3, (40, 160, 220), -1)
+    ok, encoded = cv2.imencode(".jpg", image)
+    if not ok:
+        raise RuntimeError("Could not encode synthetic image")
+    return encoded.tobytes()
+
+
+class StubImageServer:
+    """
+    Serves synthetic JPEGs at /meal-<n>.jpg so /meal-ocr never touches a real image host.
+    """
+
+    def __init__(self, distinct_images: int):
+        self.images = {f"/meal-{i}.jpg": _synthetic_jpeg(i) for i in range(distinct_images)}
+        self.port = _free_port()
+        images = self.images
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = images.get(self.path)
+                if body is None:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "image/jpeg")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", self.port), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def url(self, n: int) -> str:
+        return f"http://127.0.0.1:{self.port}/meal-{n}.jpg"
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+
+
+class FakeRedis:
+    """
+    Minimal in-memory RESP server (PING, SELECT, GET, SET [EX], DEL, EXISTS, INCR, EXPIRE,
+    FLUSHALL, PUBLISH, SUBSCRIBE, UNSUBSCRIBE) so the service can be pointed at
+    REDIS_HOST/REDIS_PORT without a real Redis, including coach context sync between workers.
+    """
+
+    def __init__(self):
+        self.port = _free_port()
+        self._data: Dict[bytes, bytes] = {}
+        self._expiry: Dict[bytes, float] = {}
+        self._subscribers: Dict[bytes, set] = {}
+        self._clients: set = set()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._ready = threading.Event()
+
+    def start(self):
+        self._thread.start()
+        self._ready.wait()
+
+    def stop(self):
+        # Close client connections (e.g. the coach context subscriber) while the loop still runs
+        asyncio.run_coroutine_threadsafe(self._close_clients(), self._loop).result(timeout=5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+    async def _close_clients(self):
+        for task in self._clients:
+            task.cancel()
+        await asyncio.gather(*self._clients, return_exceptions=True)
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_until_complete(asyncio.start_server(self._handle, "127.0.0.1", self.port))
+        self._ready.set()
+        self._loop.run_forever()
+
+    def _live(self, key: bytes) -> Optional[bytes]:
+        expires = self._expiry.get(key)
+        if expires is not None and expires <= time.monotonic():
+            self._data.pop(key, None)
+            self._expiry.pop(key, None)
+        return self._data.get(key)
+
+    @staticmethod
+    def _array(*items: bytes) -> bytes:
+        encoded = b"".join(b":%d\r\n" % item if isinstance(item, int) else b"$%d\r\n%s\r\n" % (len(item), item) for item in items)
+        return b"*%d\r\n%s" % (len(items), encoded)
+
+    def _execute(self, args: List[bytes], writer: asyncio.StreamWriter) -> bytes:
+        command = args[0].upper()
+        if command == b"PING":
+            return b"+PONG\r\n"
+        if command in (b"SELECT", b"CLIENT"):
+            return b"+OK\r\n"
+        if command == b"PUBLISH":
+            receivers = self._subscribers.get(args[1], set())
+            for receiver in receivers:
+                receiver.write(self._array(b"message", args[1], args[2]))
+            return b":%d\r\n" % len(receivers)
+        if command == b"SUBSCRIBE":
+            replies = []
+            for channel in args[1:]:
+                self._subscribers.setdefault(channel, set()).add(writer)
+                replies.append(self._array(b"subscribe", channel, self._subscription_count(writer)))
+            return b"".join(replies)
+        if command == b"UNSUBSCRIBE":
+            replies = []
+            for channel in args[1:] or [c for c, w in self._subscribers.items() if writer in w]:
+                self._subscribers.get(channel, set()).discard(writer)
+                replies.append(self._array(b"unsubscribe", channel, self._subscription_count(writer)))
+            return b"".join(replies)
+        if command == b"GET":
+            value = self._live(args[1])
+            return b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value)
+        if command == b"SET":
+            self._data[args[1]] = args[2]
+            self._expiry.pop(args[1], None)
+            if len(args) >= 5 and args[3].upper() == b"EX":
+                self._expiry[args[1]] = time.monotonic() + int(args[4])
+            return b"+OK\r\n"
+        if command == b"DEL":
+            removed = sum(1 for key in args[1:] if self._data.pop(key, None) is not None)
+            return b":%d\r\n" % removed
+        if command == b"EXISTS":
+            return b":%d\r\n" % sum(1 for key in args[1:] if self._live(key) is not None)
+        if command == b"INCR":
+            value = int(self._live(args[1]) or b"0") + 1
+            self._data[args[1]] = str(value).encode()
+            return b":%d\r\n" % value
+        if command == b"EXPIRE":
+            if self._live(args[1]) is None:
+                return b":0\r\n"
+            self._expiry[args[1]] = time.monotonic() + int(args[2])
+            return b":1\r\n"
+        if command == b"FLUSHALL":
+            self._data.clear()
+            self._expiry.clear()
+            return b"+OK\r\n"
+        return b"-ERR unknown command '%s'\r\n" % command
+
+    def _subscription_count(self, writer: asyncio.StreamWriter) -> int:
+        return sum(1 for receivers in self._subscribers.values() if writer in receivers)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._clients.add(asyncio.current_task())
+        try:
+            while True:
+                header = await reader.readline()
+                if not header:
+                    break
+                if not header.startswith(b"*"):
+                    # Inline command, e.g. "PING\r\n" from redis-cli
+                    args = header.strip().split()
+                else:
+                    args = []
+                    for _ in range(int(header[1:])):
+                        length = int((await reader.readline())[1:])
+                        args.append((await reader.readexactly(length + 2))[:-2])
+                if args:
+                    writer.write(self._execute(args, writer))
+                    await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError, asyncio.CancelledError):
+            # Cancelled by stop(); end normally so the stream callback doesn't log it
+            pass
+        finally:
+            for receivers in self._subscribers.values():
+                receivers.discard(writer)
+            self._clients.discard(asyncio.current_task())
+            writer.close()
+
+
+class ProcessSampler:
+    """
+    Samples CPU time and RSS of the server process and its workers from /proc (Linux only).
+    """
+
+    def __init__(self, root_pid: int, interval: float = 0.5):
+        self.root_pid = root_pid
+        self.interval = interval
+        self._first_cpu: Dict[int, float] = {}
+        self._last_cpu: Dict[int, float] = {}
+        self._peak_rss: Dict[int, int] = defaultdict(int)
+        self._started = 0.0
+        self._stopped = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    @staticmethod
+    def available() -> bool:
+        return os.path.isdir("/proc/self/task")
+
+    def start(self):
+        self._started = time.monotonic()
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self._stopped = time.monotonic()
+
+    def report(self) -> Dict[int, Dict[str, float]]:
+        elapsed = max(1e-9, self._stopped - self._started)
+        return {
+            pid: {
+                "cpuPercent": 100 * (self._last_cpu[pid] - self._first_cpu[pid]) / elapsed,
+                "peakRssMb": self._peak_rss[pid] / 1024,
+            }
+            for pid in self._last_cpu
+        }
+
+    def _pids(self) -> List[int]:
+        pids, pending = [], [self.root_pid]
+        while pending:
+            pid = pending.pop()
+            pids.append(pid)
+            try:
+                with open(f"/proc/{pid}/task/{pid}/children") as f:
+                    pending.extend(int(child) for child in f.read().split())
+            except OSError:
+                pass
+        return pids
+
+    def _sample(self):
+        ticks = os.sysconf("SC_CLK_TCK")
+        for pid in self._pids():
+            try:
+                with open(f"/proc/{pid}/stat") as f:
+                    # Fields after the parenthesised command name; utime and stime are 14th and 15th
+                    fields = f.read().rsplit(")", 1)[1].split()
+                cpu = (int(fields[11]) + int(fields[12])) / ticks
+                with open(f"/proc/{pid}/status") as f:
+                    rss_kb = next(int(line.split()[1]) for line in f if line.startswith("VmRSS:"))
+            except (OSError, StopIteration, IndexError, ValueError):
+                continue
+            self._first_cpu.setdefault(pid, cpu)
+            self._last_cpu[pid] = cpu
+            self._peak_rss[pid] = max(self._peak_rss[pid], rss_kb)
+
+    def _run(self):
+        self._sample()
+        while not self._stop.wait(self.interval):
+            self._sample()
+        self._sample()
+
+
+class TrafficMix:
+    """
+    Builds request payloads that validate against the request models the FastAPI
+    endpoints declare, posted under settings.API_V1_STR (/api/v1).
+
+    These are not the payloads routes/ai.js sends today. callAiService posts under
+    /api/v1/ai, and for two endpoints its field names don't match the models:
+    journal analysis sends `text` where JournalNLPRequest expects `journalText`, and
+    posture analysis sends `postureData`/`workoutId` where PoseDetectionRequest expects
+    `imageData`/`exerciseType`. Replaying the Node payloads verbatim would only measure
+    404s and 422s, so the harness targets the service's own contract instead.
+    Chat and meal payloads carry the same fields Node sends.
+
+    `distinct` bounds how many different payloads exist per endpoint, so lowering it
+    raises the share of duplicate concurrent requests.
+    """
+
+    def __init__(self, weights: Dict[str, float], images: StubImageServer, distinct: int, users: int, seed: int):
+        self.kinds = list(weights)
+        self.weights = [weights[kind] for kind in self.kinds]
+        self.images = images
+        self.distinct = distinct
+        self.users = users
+        self.rng = random.Random(seed)
+        self.frames = [
+            "data:image/jpeg;base64," + base64.b64encode(_synthetic_jpeg(1000 + i, size=224)).decode()
+            for i in range(min(distinct, 16))
+        ]
+
+    def next(self):
+        kind = self.rng.choices(self.kinds, weights=self.weights)[0]
+        n = self.rng.randrange(self.distinct)
+        user_id = f"loadtest-user-{self.rng.randrange(self.users)}"
+        if kind == "chat":
+            payload = {"userId": user_id, "message": CHAT_MESSAGES[n % len(CHAT_MESSAGES)]}
+        elif kind == "meal":
+            payload = {"userId": user_id, "imageUrl": self.images.url(n), "mealEntryId": f"meal-{n}"}
+        elif kind == "journal":
+            payload = {"userId": user_id, "journalText": JOURNAL_TEXTS[n % len(JOURNAL_TEXTS)], "journalEntryId": f"journal-{n}"}
+        else:
+            payload = {"userId": user_id, "imageData": self.frames[n % len(self.frames)], "exerciseType": EXERCISES[n % len(EXERCISES)]}
+        return kind, payload
+
+
+class Results:
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.max_in_flight = 0
+        self.max_schedule_lag = 0.0
+        self.elapsed = 0.0
+        self.send_window = 0.0
+        self.sent = 0
+
+    def record(self, kind: str, outcome: str, latency: float):
+        self.latencies[kind].append(latency)
+        self.statuses[kind][outcome] += 1
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return float("nan")
+    index = min(len(sorted_values) - 1, max(0, math.ceil(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def _parse_mix(spec: str) -> Dict[str, float]:
+    weights = {}
+    for part in spec.split(","):
+        kind, _, weight = part.partition("=")
+        kind = kind.strip()
+        if kind not in ENDPOINTS:
+            raise SystemExit(f"Unknown endpoint '{kind}' in --mix; choose from {', '.join(ENDPOINTS)}")
+        weights[kind] = float(weight or 1)
+    return weights
+
+
+def _in_process_app():
+    from fastapi import FastAPI
+    from app.core.config import settings
+    from app.api.endpoints import ai_coach, journal_nlp, meal_ocr, metrics, pose_detection
+
+    app = FastAPI(title=f"{settings.PROJECT_NAME} (load test)")
+    for module in (ai_coach, journal_nlp, meal_ocr, pose_detection, metrics):
+        app.include_router(module.router, prefix=settings.API_V1_STR)
+    return app
+
+
+async def _send(client: httpx.AsyncClient, results: Results, kind: str, path: str, payload: dict, in_flight: List[int]):
+    in_flight[0] += 1
+    results.max_in_flight = max(results.max_in_flight, in_flight[0])
+    started = time.perf_counter()
+    try:
+        response = await client.post(path, json=payload)
+        outcome = str(response.status_code)
+    except httpx.TimeoutException:
+        outcome = "timeout"
+    except Exception as e:
+        # Any other failure is an error outcome for this request, never a crash of the run
+        outcome = type(e).__name__
+    finally:
+        in_flight[0] -= 1
+    results.record(kind, outcome, time.perf_counter() - started)
+
+
+async def run_load(client: httpx.AsyncClient, mix: TrafficMix, base_path: str, rps: float, duration: float, seed: int) -> Results:
+    results = Results()
+    rng = random.Random(seed)
+    in_flight = [0]
+    tasks = set()
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    next_arrival = start
+    while next_arrival - start < duration:
+        delay = next_arrival - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        results.max_schedule_lag = max(results.max_schedule_lag, loop.time() - next_arrival)
+        kind, payload = mix.next()
+        results.sent += 1
+        task = asyncio.create_task(_send(client, results, kind, base_path + ENDPOINTS[kind], payload, in_flight))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+        next_arrival += rng.expovariate(rps)
+    results.send_window = loop.time() - start
+    if tasks:
+        await asyncio.wait(tasks)
+    results.elapsed = loop.time() - start
+    return results
+
+
+def _child_label(pid: int) -> str:
+    try:
+        with open(f"/proc/{pid}/cmdline", "rb") as f:
+            cmdline = f.read()
+    except OSError:
+        return "child"
+    # multiprocessing starts a resource tracker alongside uvicorn's workers
+    return "helper" if b"resource_tracker" in cmdline else "worker"
+
+
+def print_report(results: Results, processes: Optional[Dict[int, Dict[str, float]]], root_label: str = "server"):
+    print(f"\n{'endpoint':<10}{'reqs':>7}{'ok/s':>9}{'err%':>8}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}{'max ms':>9}  statuses")
+    # Rates are per second of the send window, matching the offered rate below. Every
+    # counted request arrived in that window; dividing by elapsed would also count the
+    # drain, where nothing new is sent, and understate throughput.
+    window = max(results.send_window, 1e-9)
+    all_latencies, total, total_ok = [], 0, 0
+    for kind in ENDPOINTS:
+        latencies = sorted(results.latencies.get(kind, []))
+        if not latencies:
+            continue
+        statuses = results.statuses[kind]
+        ok = sum(count for outcome, count in statuses.items() if outcome.startswith("2"))
+        all_latencies.extend(latencies)
+        total += len(latencies)
+        total_ok += ok
+        print(
+            f"{kind:<10}{len(latencies):>7}{ok / window:>9.1f}{100 * (1 - ok / len(latencies)):>8.1f}"
+            f"{1000 * _percentile(latencies, 50):>9.1f}{1000 * _percentile(latencies, 90):>9.1f}"
+            f"{1000 * _percentile(latencies, 99):>9.1f}{1000 * latencies[-1]:>9.1f}  {dict(statuses)}"
+        )
+    all_latencies.sort()
+    if total:
+        print(
+            f"{'all':<10}{total:>7}{total_ok / window:>9.1f}{100 * (1 - total_ok / total):>8.1f}"
+            f"{1000 * _percentile(all_latencies, 50):>9.1f}{1000 * _percentile(all_latencies, 90):>9.1f}"
+            f"{1000 * _percentile(all_latencies, 99):>9.1f}{1000 * all_latencies[-1]:>9.1f}"
+        )
+    print(f"\nOffered {results.sent / results.send_window:.1f} req/s over {results.send_window:.1f}s "
+          f"({results.elapsed:.1f}s including drain), max in flight {results.max_in_flight}, "
+          f"max arrival lag {1000 * results.max_schedule_lag:.1f} ms")
+    if results.max_schedule_lag > 0.05:
+        print("Warning: the load generator fell behind its arrival schedule; latencies include "
+              "client-side queueing. Lower --rps or run several generators.")
+    if processes:
+        print(f"\n{'pid':>8}{'cpu %':>9}{'peak RSS MB':>14}  process")
+        root_pid = min(processes)
+        for pid, usage in sorted(processes.items()):
+            label = root_label if pid == root_pid else _child_label(pid)
+            print(f"{pid:>8}{usage['cpuPercent']:>9.1f}{usage['peakRssMb']:>14.1f}  {label}")
+
+
+def _wait_for_port(port: int, timeout: float):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with socket.socket() as s:
+            if s.connect_ex(("127.0.0.1", port)) == 0:
+                return
+        time.sleep(0.2)
+    raise SystemExit(f"uvicorn did not start listening on port {port} within {timeout}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay backend traffic against the AI service.")
+    parser.add_argument("--rps", type=float, default=20, help="Target arrival rate (requests/second)")
+    parser.add_argument("--duration", type=float, default=20, help="Seconds of load to generate")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"Endpoint weights, default {DEFAULT_MIX}")
+    parser.add_argument("--distinct", type=int, default=50, help="Distinct payloads per endpoint (lower = more duplicates)")
+    parser.add_argument("--users", type=int, default=100, help="Distinct user IDs")
+    parser.add_argument("--url", help="Target an already running service instead of the in-process app")
+    parser.add_argument("--server-pid", type=int, help="With --url, sample CPU/RSS of this process and its workers")
+    parser.add_argument("--spawn-uvicorn", action="store_true", help="Start the service under uvicorn for the run")
+    parser.add_argument("--app", default="app.main:app", help="uvicorn app path used with --spawn-uvicorn")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers used with --spawn-uvicorn")
+    parser.add_argument("--base-path", help="Route prefix, defaults to settings.API_V1_STR")
+    parser.add_argument("--timeout", type=float, default=30, help="Per-request client timeout in seconds")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    images = StubImageServer(args.distinct)
+    images.start()
+    redis = FakeRedis()
+    redis.start()
+    # Point the service (in-process or spawned) at the stand-ins before settings are loaded
+    os.environ["REDIS_HOST"] = "127.0.0.1"
+    os.environ["REDIS_PORT"] = str(redis.port)
+    os.environ.setdefault("AI_SERVICE_SECRET_KEY", "load-test")
+    os.environ.setdefault("SECRET_KEY", "load-test")
+
+    if args.base_path is None:
+        from app.core.config import settings
+        args.base_path = settings.API_V1_STR
+
+    server = None
+    sampler = None
+    root_label = "server"
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=200)
+    if args.spawn_uvicorn:
+        port = _free_port()
+        server = subprocess.Popen([
+            sys.executable, "-m", "uvicorn", args.app, "--host", "127.0.0.1", "--port", str(port),
+            "--workers", str(args.workers), "--log-level", "warning",
+        ])
+        _wait_for_port(port, timeout=60)
+        client = httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", timeout=args.timeout, limits=limits)
+        server_pid = server.pid
+    elif args.url:
+        client = httpx.AsyncClient(base_url=args.url, timeout=args.timeout, limits=limits)
+        server_pid = args.server_pid
+    else:
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=_in_process_app(), raise_app_exceptions=False), base_url="http://in-process", timeout=args.timeout)
+        # Only process available: it also runs the load generator, stub image server and fake Redis
+        server_pid = os.getpid()
+        root_label = "generator+app (in-process)"
+
+    if server_pid and ProcessSampler.available():
+        sampler = ProcessSampler(server_pid)
+
+    mix = TrafficMix(_parse_mix(args.mix), images, args.distinct, args.users, args.seed)
+    print(f"Replaying {args.mix} at {args.rps} req/s for {args.duration}s against "
+          f"{'uvicorn x%d' % args.workers if server else args.url or 'in-process app'}")
+    try:
+        if sampler:
+            sampler.start()
+        results = asyncio.run(_run_with_client(client, mix, args))
+        if sampler:
+            sampler.stop()
+        print_report(results, sampler.report() if sampler else None, root_label)
+    finally:
+        if server:
+            server.terminate()
+            server.wait(timeout=10)
+        images.stop()
+        redis.stop()
+
+
+async def _run_with_client(client: httpx.AsyncClient, mix: TrafficMix, args) -> Results:
+    async with client:
+        return await run_load(client, mix, args.base_path, args.rps, args.duration, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+# data-science-service/app/services/admission_control.py
+import asyncio
+import math
+import time
+from collections import deque
+from enum import IntEnum
+from typing import Any, Deque, Dict, Optional
+
+from fastapi import HTTPException, Request, status
+
+from app.core.config import settings
+
+
+class PriorityClass(IntEnum):
+    """
+    Scheduling classes, highest priority first.
+    """
+    REALTIME = 0 # Live pose frames, worthless if late
+    INTERACTIVE = 1 # A user is waiting on the answer (coach chat, journal, meal photo)
+    BULK = 2 # Batch analyses and backfills, opted into with X-Request-Priority: bulk
+
+
+class AdmissionRejected(Exception):
+    """
+    Raised when a request is refused (queue full) or shed (deadline passed while queued).
+    """
+    def __init__(self, status_code: int, detail: str, retry_after: int):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+        self.retry_after = retry_after
+
+
+class _Waiter:
+    def __init__(self, endpoint: str, priority: PriorityClass, deadline: float, future: asyncio.Future):
+        self.endpoint = endpoint
+        self.priority = priority
+        self.deadline = deadline
+        self.future = future
+
+
+class AdmissionController:
+    """
+    Bounds how much AI work runs at once and decides what runs next.
+
+    Every request needs a slot from the shared pool and from its endpoint's own
+    limit. When no slot is free the request waits in its priority class queue;
+    freed slots always go to the highest class first, FIFO within a class.
+    Queued requests whose deadline passes are shed with a 503 instead of being
+    run late, and a full class queue rejects new arrivals with a 429.
+    """
+
+    def __init__(self, max_concurrency: int, endpoint_limits: Dict[str, int], max_queue_depth: int):
+        self.max_concurrency = max_concurrency
+        self.endpoint_limits = dict(endpoint_limits)
+        self.max_queue_depth = max_queue_depth
+        self._active_total = 0
+        self._active: Dict[str, int] = {}
+        self._queues: Dict[PriorityClass, Deque[_Waiter]] = {cls: deque() for cls in PriorityClass}
+        # Smoothed service time per endpoint, used for Retry-After hints
+        self._service_time: Dict[str, float] = {}
+        self.admitted = {cls: 0 for cls in PriorityClass}
+        self.shed = {cls: 0 for cls in PriorityClass}
+        self.rejected = {cls: 0 for cls in PriorityClass}
+
+    async def acquire(self, endpoint: str, priority: PriorityClass, deadline: float) -> None:
+        """
+        Waits for a slot for the endpoint. `deadline` is a time.monotonic() timestamp.
+        Raises AdmissionRejected if the request is refused or shed.
+        """
+        now = time.monotonic()
+        if deadline <= now:
+            self.shed[priority] += 1
+            raise self._rejection(status.HTTP_503_SERVICE_UNAVAILABLE, "Request deadline already passed", endpoint, priority)
+
+        if self._can_run(endpoint):
+            self._grant(endpoint, priority)
+            return
+
+        queue = self._queues[priority]
+        if len(queue) >= self.max_queue_depth:
+            self.rejected[priority] += 1
+            raise self._rejection(status.HTTP_429_TOO_MANY_REQUESTS, f"{priority.name.lower()} queue is full", endpoint, priority)
+
+        waiter = _Waiter(endpoint, priority, deadline, asyncio.get_running_loop().create_future())
+        queue.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), timeout=deadline - now)
+        except asyncio.TimeoutError:
+            self._discard(waiter)
+            if self._granted(waiter):
+                # Granted just as the deadline hit; too late to be useful, so hand the slot back
+                # and count it as shed rather than admitted
+                self.admitted[priority] -= 1
+                self.release(endpoint)
+            if self._granted(waiter) or not waiter.future.done():
+                # Otherwise _dispatch already shed and counted it
+                self.shed[priority] += 1
+            raise self._rejection(status.HTTP_503_SERVICE_UNAVAILABLE, "Request deadline passed while queued", endpoint, priority)
+        except asyncio.CancelledError:
+            self._discard(waiter)
+            if self._granted(waiter):
+                self.release(endpoint)
+            raise
+
+    def release(self, endpoint: str, service_time: Optional[float] = None) -> None:
+        """
+        Returns a slot and hands it to the next eligible queued request.
+        """
+        self._active_total -= 1
+        self._active[endpoint] -= 1
+        if service_time is not None:
+            previous = self._service_time.get(endpoint)
+            self._service_time[endpoint] = service_time if previous is None else 0.8 * previous + 0.2 * service_time
+        self._dispatch()
+
+    def guard(self, endpoint: str, priority: PriorityClass):
+        """
+        Builds a FastAPI dependency that holds an admission slot for the duration of the request.
+
+        Callers may demote a request to bulk with `X-Request-Priority: bulk` (e.g. backfills)
+        and set a tighter budget with `X-Request-Deadline-Ms` (capped at the class default).
+        """
+        async def dependency(request: Request):
+            request_priority = priority
+            if request.headers.get("X-Request-Priority", "").lower() == "bulk":
+                request_priority = PriorityClass.BULK
+
+            budget_ms = settings.ADMISSION_DEADLINE_MS[request_priority.name.lower()]
+            header_budget = request.headers.get("X-Request-Deadline-Ms")
+            if header_budget:
+                try:
+                    requested_ms = float(header_budget)
+                except ValueError:
+                    requested_ms = math.nan
+                if not math.isfinite(requested_ms) or requested_ms <= 0:
+                    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="X-Request-Deadline-Ms must be a positive number")
+                # Callers may tighten their budget but never extend it past the class default,
+                # otherwise any client could opt out of deadline shedding
+                budget_ms = min(budget_ms, requested_ms)
+
+            try:
+                await self.acquire(endpoint, request_priority, time.monotonic() + budget_ms / 1000)
+            except AdmissionRejected as rejected:
+                raise HTTPException(
+                    status_code=rejected.status_code,
+                    detail=rejected.detail,
+                    headers={"Retry-After": str(rejected.retry_after)}
+                )
+
+            started = time.monotonic()
+            try:
+                yield
+            finally:
+                self.release(endpoint, time.monotonic() - started)
+
+        return dependency
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns in-flight counts plus queue depth, admitted, shed and rejected counts per class.
+        """
+        return {
+            "maxConcurrency": self.max_concurrency,
+            "active": self._active_total,
+            "activeByEndpoint": dict(self._active),
+            "classes": {
+                cls.name.lower(): {
+                    "queueDepth": len(self._queues[cls]),
+                    "admitted": self.admitted[cls],
+                    "shed": self.shed[cls],
+                    "rejected": self.rejected[cls],
+                }
+                for cls in PriorityClass
+            },
+        }
+
+    def _can_run(self, endpoint: str) -> bool:
+        limit = self.endpoint_limits.get(endpoint, self.max_concurrency)
+        return self._active_total < self.max_concurrency and self._active.get(endpoint, 0) < limit
+
+    def _grant(self, endpoint: str, priority: PriorityClass) -> None:
+        self._active_total += 1
+        self._active[endpoint] = self._active.get(endpoint, 0) + 1
+        self.admitted[priority] += 1
+
+    def _dispatch(self) -> None:
+        now = time.monotonic()
+        for cls in PriorityClass:
+            queue = self._queues[cls]
+            for waiter in list(queue):
+                if self._active_total >= self.max_concurrency:
+                    return
+                if waiter.future.done():
+                    queue.remove(waiter)
+                elif waiter.deadline <= now:
+                    # Shed early rather than waiting for the waiter's own timer
+                    queue.remove(waiter)
+                    self.shed[cls] += 1
+                    waiter.future.set_exception(
+                        self._rejection(status.HTTP_503_SERVICE_UNAVAILABLE, "Request deadline passed while queued", waiter.endpoint, cls)
+                    )
+                elif self._can_run(waiter.endpoint):
+                    queue.remove(waiter)
+                    self._grant(waiter.endpoint, cls)
+                    waiter.future.set_result(None)
+
+    @staticmethod
+    def _granted(waiter: _Waiter) -> bool:
+        return waiter.future.done() and waiter.future.exception() is None
+
+    def _discard(self, waiter: _Waiter) -> None:
+        queue = self._queues[waiter.priority]
+        if waiter in queue:
+            queue.remove(waiter)
+
+    def _rejection(self, status_code: int, detail: str, endpoint: str, priority: PriorityClass) -> AdmissionRejected:
+        # Rough time until a slot frees up for this class: work queued at or above it,
+        # spread over the endpoint's slots, at the endpoint's recent service time.
+        ahead = sum(len(self._queues[cls]) for cls in PriorityClass if cls <= priority) + 1
+        slots = max(1, self.endpoint_limits.get(endpoint, self.max_concurrency))
+        service_time = self._service_time.get(endpoint, 1.0)
+        retry_after = min(60, max(1, math.ceil(ahead * service_time / slots)))
+        return AdmissionRejected(status_code, detail, retry_after)
+
+
+# Initialize service globally
+admission_controller = AdmissionController(
+    max_concurrency=settings.ADMISSION_MAX_CONCURRENCY,
+    endpoint_limits=settings.ADMISSION_ENDPOINT_LIMITS,
+    max_queue_depth=settings.ADMISSION_MAX_QUEUE_DEPTH,
+)
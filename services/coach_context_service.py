@@ -0,0 +1,186 @@
+# data-science-service/app/services/coach_context_service.py
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Dict, Optional
+
+import redis
+
+from app.core.config import settings
+
+
+class CoachContextCache:
+    """
+    Per-user snapshot of the signals the AI Coach personalises on
+    (recent mood, last workout, sleep quality, goals).
+
+    Only the fields the coach actually reads are folded in: journal analyses set the
+    recent mood and pose analyses the last workout date. Sleep quality and goals come
+    from the full fetch only; no analysis endpoint produces them.
+
+    A snapshot is created from a full fetch (put) on a chat miss. While it is live,
+    the analysis endpoints fold their results into it as they are produced, so a
+    chat turn can read it without any store round trips. The TTL counts from the
+    last full fetch, not the last update, so base fields such as goals are always
+    refetched eventually. The least recently used users are evicted once the cache
+    is full.
+
+    Snapshots live in each worker's memory, but updates are
+    broadcast over a Redis channel once connect() has been called, so an analysis
+    handled by one uvicorn worker also reaches the snapshots held by the others.
+    Without Redis each worker only sees its own analyses until the TTL expires.
+    """
+
+    def __init__(self, ttl_seconds: float, max_users: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_users = max_users
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Last payload this worker broadcast per user, so repeated identical updates
+        # (e.g. every pose frame of a workout) are only published once
+        self._published: "OrderedDict[str, str]" = OrderedDict()
+        self._origin = uuid.uuid4().hex
+        self._redis: Optional[redis.Redis] = None
+        self._channel = ""
+        self._listener = None
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+        self.updates = 0
+
+    def get(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns a copy of the cached snapshot for the user, or None on a miss.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                self.misses += 1
+                return None
+            if now - entry["fetched_at"] > self.ttl_seconds:
+                del self._entries[user_id]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return dict(entry["snapshot"])
+
+    def put(self, user_id: str, snapshot: Dict[str, Any]) -> None:
+        """
+        Stores a full snapshot for the user (e.g. fetched from MongoDB), replacing any
+        previous one and restarting its TTL.
+        """
+        with self._lock:
+            self._entries[user_id] = {"snapshot": dict(snapshot), "fetched_at": time.monotonic()}
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_users:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def connect(self, client: redis.Redis, channel: str) -> None:
+        """
+        Starts sharing updates with other workers over a Redis channel.
+        """
+        try:
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(**{channel: self._on_message})
+        except redis.RedisError as e:
+            print(f"Warning: coach context sync disabled, could not subscribe to Redis: {e}")
+            return
+        self._redis = client
+        self._channel = channel
+        self._listener = pubsub.run_in_thread(sleep_time=1.0, daemon=True, exception_handler=self._on_listener_error)
+
+    def record_journal(self, user_id: str, overall_sentiment: str) -> None:
+        """
+        Folds a fresh journal NLP result into the user's snapshot.
+        """
+        self._update(user_id, {"recent_mood": overall_sentiment})
+
+    def record_pose(self, user_id: str) -> None:
+        """
+        Records that the user worked out today.
+        """
+        self._update(user_id, {"last_workout_date": date.today().isoformat()})
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns cache counters and the current hit rate.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxUsers": self.max_users,
+                "ttlSeconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hitRate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "expirations": self.expirations,
+                "evictions": self.evictions,
+                "updates": self.updates,
+            }
+
+    def _update(self, user_id: str, fields: Dict[str, Any]) -> None:
+        self._update_local(user_id, fields)
+        payload = json.dumps({"userId": user_id, "fields": fields}, sort_keys=True)
+        with self._lock:
+            if self._published.get(user_id) == payload:
+                return
+            self._published[user_id] = payload
+            self._published.move_to_end(user_id)
+            while len(self._published) > self.max_users:
+                self._published.popitem(last=False)
+        self._publish({"userId": user_id, "fields": fields})
+
+    def _update_local(self, user_id: str, fields: Dict[str, Any]) -> None:
+        # Only a live snapshot built from a full fetch is updated. Without one, the
+        # result is dropped and the next chat turn fetches everything; creating a
+        # partial snapshot here would hide that miss and leave base fields unset.
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or now - entry["fetched_at"] > self.ttl_seconds:
+                return
+            entry["snapshot"] = {**entry["snapshot"], **fields}
+            self.updates += 1
+
+    def _publish(self, message: Dict[str, Any]) -> None:
+        if self._redis is None:
+            return
+        try:
+            self._redis.publish(self._channel, json.dumps({**message, "origin": self._origin}))
+        except redis.RedisError as e:
+            # Other workers keep their snapshot until it expires; this worker is already up to date
+            print(f"Warning: could not publish coach context update: {e}")
+
+    def _on_message(self, message: Dict[str, Any]) -> None:
+        try:
+            event = json.loads(message["data"])
+        except (TypeError, ValueError):
+            return
+        if event.get("origin") == self._origin or "fields" not in event:
+            return
+        self._update_local(event["userId"], event["fields"])
+
+    def _on_listener_error(self, error: Exception, pubsub, thread) -> None:
+        # redis-py reconnects and resubscribes on the next poll; just avoid a busy loop
+        print(f"Warning: coach context sync lost its Redis connection: {error}")
+        time.sleep(1.0)
+
+
+# Initialize service globally
+coach_context_cache = CoachContextCache(
+    ttl_seconds=settings.COACH_CONTEXT_TTL_SECONDS,
+    max_users=settings.COACH_CONTEXT_MAX_USERS,
+)
+coach_context_cache.connect(
+    redis.Redis(host=settings.REDIS_HOST, port=settings.REDIS_PORT, db=settings.REDIS_DB, socket_connect_timeout=2),
+    settings.COACH_CONTEXT_CHANNEL,
+)
@@ -98,30 +98,21 @@ class OCRService:
                 serving_factor = np.random.uniform(0.8, 1.2) # Simulate slight variation in portion size
                 quantity = f"{round(food_info['serving_size_g'] * serving_factor)}g (estimated)"
                 
-                calories = food_info["calories"] * serving_factor
-                macros = Macronutrients(
-                    protein=food_info["protein"] * serving_factor,
-                    carbohydrates=food_info["carbohydrates"] * serving_factor,
-                    fats=food_info["fats"] * serving_factor
-                )
-                micros = Micronutrients(
-                    fiber=food_info.get("fiber", 0.0) * serving_factor,
-                    sugar=food_info.get("sugar", 0.0) * serving_factor, # Assuming sugar might be in db
-                    sodium=food_info.get("sodium", 0.0) * serving_factor # Assuming sodium might be in db
-                )
-                predictions.append(FoodItemPrediction(
+                # Values come straight from our own database and arithmetic, so the models are
+                # built once, already rounded, and without re-running validation.
+                predictions.append(FoodItemPrediction.model_construct(
                     name=food_name.replace('_', ' ').title(), # Format for display
                     quantity=quantity,
-                    calories=round(calories, 1),
-                    macronutrients=Macronutrients(
-                        protein=round(macros.protein, 1),
-                        carbohydrates=round(macros.carbohydrates, 1),
-                        fats=round(macros.fats, 1)
+                    calories=round(food_info["calories"] * serving_factor, 1),
+                    macronutrients=Macronutrients.model_construct(
+                        protein=round(food_info["protein"] * serving_factor, 1),
+                        carbohydrates=round(food_info["carbohydrates"] * serving_factor, 1),
+                        fats=round(food_info["fats"] * serving_factor, 1)
                     ),
-                    micronutrients=Micronutrients(
-                        fiber=round(micros.fiber, 1),
-                        sugar=round(micros.sugar, 1),
-                        sodium=round(micros.sodium, 1)
+                    micronutrients=Micronutrients.model_construct(
+                        fiber=round(food_info.get("fiber", 0.0) * serving_factor, 1),
+                        sugar=round(food_info.get("sugar", 0.0) * serving_factor, 1), # Assuming sugar might be in db
+                        sodium=round(food_info.get("sodium", 0.0) * serving_factor, 1) # Assuming sodium might be in db
                     )
                 ))
             else:
@@ -2,10 +2,64 @@
 import cv2
 import numpy as np
 import base64
+from functools import lru_cache
 from typing import List, Dict
+from pydantic import ConfigDict
 from app.core.config import settings
 from app.core.models import PoseFeedbackItem
 
+class _FeedbackTemplate(PoseFeedbackItem):
+    # Templates are shared between requests (and coalesced callers), so they must not be mutated
+    model_config = ConfigDict(frozen=True)
+
+# Feedback text does not change between frames, so each item is built once at import
+# instead of being constructed and validated again for every frame.
+FEEDBACK_TEMPLATES = {
+    "squat_knees": _FeedbackTemplate(
+        joint="Knees",
+        feedback="Knees are caving inwards. This can put stress on your joints.",
+        correction="Push knees out, align them over your toes throughout the movement."
+    ),
+    "squat_back": _FeedbackTemplate(
+        joint="Back",
+        feedback="Your lower back is rounding slightly.",
+        correction="Keep your chest up and core engaged to maintain a neutral spine."
+    ),
+    "squat_good": _FeedbackTemplate(
+        joint="Overall",
+        feedback="Excellent depth and control!",
+        correction="Maintain this form."
+    ),
+    "plank_hips": _FeedbackTemplate(
+        joint="Hips",
+        feedback="Hips are sagging towards the floor.",
+        correction="Tighten glutes and pull navel towards spine to lift hips."
+    ),
+    "plank_neck": _FeedbackTemplate(
+        joint="Neck",
+        feedback="Your neck position is not neutral.",
+        correction="Look down at the floor, keeping your neck in line with your spine."
+    ),
+    "tree_pose_standing_leg": _FeedbackTemplate(
+        joint="Standing Leg",
+        feedback="Slight wobble detected in your standing leg.",
+        correction="Engage your glutes and core for better stability."
+    ),
+    "tree_pose_hips": _FeedbackTemplate(
+        joint="Hips",
+        feedback="Hips are not fully squared forward.",
+        correction="Gently rotate your hip forward to align."
+    ),
+}
+
+@lru_cache(maxsize=256)
+def _general_feedback(exercise_type: str) -> PoseFeedbackItem:
+    return _FeedbackTemplate(
+        joint="General",
+        feedback=f"Good general form for {exercise_type.replace('_', ' ').title()}.",
+        correction="Keep up the great work!"
+    )
+
 # You might need to install mediapipe: pip install mediapipe
 # import mediapipe as mp # Uncomment if using MediaPipe
 
@@ -79,56 +133,24 @@ class PoseService:
             if exerciseType.lower() == "squat":
                 overall_score = np.random.randint(60, 95) # Random score for simulation
                 if overall_score < 75:
-                    feedback_items.append(PoseFeedbackItem(
-                        joint="Knees",
-                        feedback="Knees are caving inwards. This can put stress on your joints.",
-                        correction="Push knees out, align them over your toes throughout the movement."
-                    ))
+                    feedback_items.append(FEEDBACK_TEMPLATES["squat_knees"])
                 if overall_score < 80:
-                     feedback_items.append(PoseFeedbackItem(
-                        joint="Back",
-                        feedback="Your lower back is rounding slightly.",
-                        correction="Keep your chest up and core engaged to maintain a neutral spine."
-                    ))
+                    feedback_items.append(FEEDBACK_TEMPLATES["squat_back"])
                 else:
-                    feedback_items.append(PoseFeedbackItem(
-                        joint="Overall",
-                        feedback="Excellent depth and control!",
-                        correction="Maintain this form."
-                    ))
+                    feedback_items.append(FEEDBACK_TEMPLATES["squat_good"])
             elif exerciseType.lower() == "plank":
                 overall_score = np.random.randint(70, 98)
                 if overall_score < 80:
-                     feedback_items.append(PoseFeedbackItem(
-                        joint="Hips",
-                        feedback="Hips are sagging towards the floor.",
-                        correction="Tighten glutes and pull navel towards spine to lift hips."
-                    ))
-                feedback_items.append(PoseFeedbackItem(
-                    joint="Neck",
-                    feedback="Your neck position is not neutral.",
-                    correction="Look down at the floor, keeping your neck in line with your spine."
-                ))
+                    feedback_items.append(FEEDBACK_TEMPLATES["plank_hips"])
+                feedback_items.append(FEEDBACK_TEMPLATES["plank_neck"])
             elif exerciseType.lower() == "yoga_tree_pose": # Example for yoga posture
                 overall_score = np.random.randint(50, 90)
                 if overall_score < 70:
-                    feedback_items.append(PoseFeedbackItem(
-                        joint="Standing Leg",
-                        feedback="Slight wobble detected in your standing leg.",
-                        correction="Engage your glutes and core for better stability."
-                    ))
-                feedback_items.append(PoseFeedbackItem(
-                    joint="Hips",
-                    feedback="Hips are not fully squared forward.",
-                    correction="Gently rotate your hip forward to align."
-                ))
+                    feedback_items.append(FEEDBACK_TEMPLATES["tree_pose_standing_leg"])
+                feedback_items.append(FEEDBACK_TEMPLATES["tree_pose_hips"])
             else:
                 overall_score = np.random.randint(75, 100)
-                feedback_items.append(PoseFeedbackItem(
-                    joint="General",
-                    feedback=f"Good general form for {exerciseType.replace('_', ' ').title()}.",
-                    correction="Keep up the great work!"
-                ))
+                feedback_items.append(_general_feedback(exerciseType))
 
             # Simulate repetition count for some exercises
             repetition_count = None
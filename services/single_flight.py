@@ -0,0 +1,91 @@
+# data-science-service/app/services/single_flight.py
+import asyncio
+import hashlib
+from typing import Any, Awaitable, Callable, Dict
+
+
+def canonical_key(namespace: str, *parts: str) -> str:
+    """
+    Builds a compact, stable key for a request so that duplicates map to the same entry.
+    Large payloads (e.g. journal text) are hashed rather than kept as-is.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        encoded = (part or "").encode("utf-8")
+        # Length-prefix each part so ("ab", "c") and ("a", "bc") differ
+        digest.update(len(encoded).to_bytes(8, "big"))
+        digest.update(encoded)
+    return f"{namespace}:{digest.hexdigest()}"
+
+
+class _Call:
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesces identical in-flight async computations.
+
+    The first caller for a key starts the computation; concurrent callers with the
+    same key await that same computation and receive its result or exception.
+    The entry is dropped as soon as the computation finishes, so nothing is cached
+    beyond the lifetime of the call.
+
+    If a caller is cancelled (e.g. the client disconnected), only that caller stops
+    waiting. The shared computation is cancelled only once every caller has gone.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, _Call] = {}
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        call = self._calls.get(key)
+        if call is None:
+            call = _Call(asyncio.ensure_future(fn()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda _task, key=key, call=call: self._forget(key, call))
+            self.executions += 1
+        else:
+            self.coalesced += 1
+
+        call.waiters += 1
+        try:
+            # shield() keeps one caller's cancellation from cancelling everyone else's result
+            return await asyncio.shield(call.task)
+        except asyncio.CancelledError:
+            if call.task.cancelled() or call.waiters > 1:
+                raise
+            # Forget the call before cancelling it, so a duplicate arriving before the
+            # done callback runs starts fresh instead of joining the dying task
+            self._forget(key, call)
+            call.task.cancel()
+            raise
+        finally:
+            call.waiters -= 1
+
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns how many computations actually ran and how many callers piggybacked on them.
+        """
+        requests = self.executions + self.coalesced
+        return {
+            "inFlight": len(self._calls),
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "coalescedRate": round(self.coalesced / requests, 4) if requests else 0.0,
+        }
+
+    def _forget(self, key: str, call: _Call) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+
+# Shared by the endpoint modules
+single_flight = SingleFlight()